@@ -151,6 +151,80 @@ data_type parse(const cstr &file, char sep = '|') {
     return result;
 }
 
+cstr format_value(py::handle obj) {
+    // Mesmo texto que um f-string ({obj}) geraria: format(obj, '')
+    PyObject *formatted = PyObject_Format(obj.ptr(), py::str().ptr());
+
+    if (formatted == nullptr) {
+        throw py::error_already_set();
+    }
+
+    return py::reinterpret_steal<py::str>(formatted).cast<cstr>();
+}
+
+[[noreturn]] void raise_io_error(const cstr &file) {
+    // Mesmo OSError (errno + nome do arquivo) que o open()/write() do Python
+    if (errno == 0) {
+        errno = EIO;
+    }
+    PyErr_SetFromErrnoWithFilename(PyExc_OSError, file.c_str());
+    throw py::error_already_set();
+}
+
+void write_batch(const cstr &file, const py::dict &data, char sep = '|') {
+    cstr buffer;
+    buffer.reserve(data.size() * 32);
+
+    for (auto item: data) {
+        PyObject *value = item.second.ptr();
+
+        buffer += format_value(item.first);
+        buffer += sep;
+
+        if (PyBool_Check(value)) {
+            buffer += value == Py_True ? "bool:true" : "bool:false";
+        } else if (PyUnicode_CheckExact(value)) {
+            buffer += "str:\"";
+            buffer += item.second.cast<cstr>();
+            buffer += '\"';
+        } else if (PyLong_CheckExact(value)) {
+            buffer += "int:";
+            buffer += py::str(item.second).cast<cstr>();
+        } else if (PyFloat_CheckExact(value)) {
+            buffer += "float:";
+            buffer += py::str(item.second).cast<cstr>();
+        } else {
+            buffer += py::str(py::type::handle_of(item.second).attr("__name__")).cast<cstr>();
+            buffer += ':';
+            if (PyUnicode_Check(value)) {
+                buffer += '\"';
+                buffer += format_value(item.second);
+                buffer += '\"';
+            } else {
+                buffer += format_value(item.second);
+            }
+        }
+        buffer += '\n';
+    }
+
+    errno = 0;
+    std::ofstream outputFile(file, std::ios::app | std::ios::binary);
+
+    if (!outputFile.is_open()) {
+        raise_io_error(file);
+    }
+
+    outputFile.write(buffer.data(), static_cast<std::streamsize>(buffer.size()));
+    if (!outputFile) {
+        raise_io_error(file);
+    }
+
+    outputFile.close();
+    if (!outputFile) {
+        raise_io_error(file);
+    }
+}
+
 PYBIND11_MODULE(nkv_parser, m) {
     m.doc() = "Um teste do PyBind11";
 
@@ -159,4 +233,6 @@ PYBIND11_MODULE(nkv_parser, m) {
     m.def("tsplit", &tsplit, "Função que divide uma string em dois separadores", py::arg("s"), py::arg("sep1"),
           py::arg("sep2"));
     m.def("split", &split, "Função que separa a string em um ponto", py::arg("string"), py::arg("sep"));
+    m.def("write_batch", &write_batch, "Escreve um dict inteiro no arquivo NKV de uma vez", py::arg("file"),
+          py::arg("data"), py::arg("sep") = '|');
 }
@@ -1,5 +1,6 @@
 #pragma once
 
+#include <cerrno>
 #include <fstream>
 #include <iostream>
 #include <string>
@@ -25,6 +25,16 @@ class NKVManager(FileManager):
         'dict': ['{', '}'],
         'tuple': ['(', ')'],
     }
+    TYPE_MAP: dict[str, Any] = {
+        'str': lambda x: x,
+        'int': int,
+        'float': float,
+        'bool': lambda x: x.lower() == 'true',
+        'list': ast.literal_eval,
+        'dict': ast.literal_eval,
+        'tuple': ast.literal_eval,
+        'nonetype': lambda x: None
+    }
 
     def __init__(self, name: str, path: str = './', sep_type: str = '|') -> None:
         if '.' in name:
@@ -201,40 +211,54 @@ class NKVManager(FileManager):
     def write_batch(self, data: dict[str, Any] | list[dict[str, Any]], beauty: bool = False) -> None:
         """
         Escreve múltiplos valores de uma vez (otimizado para abundância de dados)
+
+        As linhas são montadas em memória e gravadas com um único write(),
+        em vez de uma chamada de escrita por chave. Para dicts, usa o
+        nkv_parser.write_batch (C++) quando o módulo compilado o tiver.
         """
-        with open(self.arquivo, 'a', encoding='utf-8') as file:
-            if isinstance(data, dict):
-                for key, value in data.items():
-                    tipo = type(value).__name__
+        if isinstance(data, dict) and hasattr(nkv_parser, 'write_batch'):
+            nkv_parser.write_batch(file=self.arquivo, data=data, sep=self.sep_type)
+            return
 
-                    if isinstance(value, str):
-                        file.write(f'{key}{self.sep_type}{tipo}:"{value}"\n')
-                    elif isinstance(value, bool):
-                        file.write(f'{key}{self.sep_type}{tipo}:{str(value).lower()}\n')
-                    else:
-                        file.write(f'{key}{self.sep_type}{tipo}:{value}\n')
-            elif isinstance(data, list):
-                for obj in data:
-                    try:
-                        for key, value in obj.items():
-                            tipo = type(value).__name__
-
-                            if isinstance(value, str):
-                                file.write(f'{key}{self.sep_type}{tipo}:"{value}"\n')
-                            elif isinstance(value, bool):
-                                file.write(f'{key}{self.sep_type}{tipo}:{str(value).lower()}\n')
-                            else:
-                                file.write(f'{key}{self.sep_type}{tipo}:{value}\n')
-                        if beauty: file.write('\n')
-                    except Exception as e:
-                        err(f'\033[1;34m{e}')
+        sep = self.sep_type
+        lines: list[str] = []
+        append = lines.append
+
+        if isinstance(data, dict):
+            for key, value in data.items():
+                tipo = type(value).__name__
+
+                if isinstance(value, str):
+                    append(f'{key}{sep}{tipo}:"{value}"\n')
+                elif isinstance(value, bool):
+                    append(f'{key}{sep}{tipo}:{str(value).lower()}\n')
+                else:
+                    append(f'{key}{sep}{tipo}:{value}\n')
+        elif isinstance(data, list):
+            for obj in data:
+                try:
+                    for key, value in obj.items():
+                        tipo = type(value).__name__
+
+                        if isinstance(value, str):
+                            append(f'{key}{sep}{tipo}:"{value}"\n')
+                        elif isinstance(value, bool):
+                            append(f'{key}{sep}{tipo}:{str(value).lower()}\n')
+                        else:
+                            append(f'{key}{sep}{tipo}:{value}\n')
+                    if beauty: append('\n')
+                except Exception as e:
+                    err(f'\033[1;34m{e}')
+
+        with open(self.arquivo, 'a', encoding='utf-8') as file:
+            file.write(''.join(lines))
 
     def jsonify(self, indent: int = 2) -> str:
         """
         Converte NKV para JSON string
         ✅ Já funciona perfeitamente!
         """
-        data = self.read(big_data=False)
+        data = self.read(c_parse=False)
         return json.dumps(data, indent=indent, ensure_ascii=False)
 
     def to_json_file(self, json_path: str, indent: int = 2) -> None:
@@ -242,9 +266,16 @@ class NKVManager(FileManager):
         Converte NKV para arquivo JSON
         ✅ Já funciona perfeitamente!
         """
-        data = self.read(big_data=False)
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=indent, ensure_ascii=False)
+        data = self.read(c_parse=False)
+        buf = memoryview(json.dumps(data, indent=indent, ensure_ascii=False).encode('utf-8'))
+
+        # Um único os.write em vez de vários writes pequenos do json.dump
+        fd = os.open(json_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            while buf:
+                buf = buf[os.write(fd, buf):]
+        finally:
+            os.close(fd)
 
     def nkvify(self, json_file: str, typed: bool = True) -> str:
         """
@@ -395,17 +426,6 @@ class NKVManager(FileManager):
             return file.read()
 
     def _read_python(self):
-        TYPE_MAP: dict[str, Any] = {
-            'str': lambda x: x,
-            'int': int,
-            'float': float,
-            'bool': lambda x: x.lower() == 'true',
-            'list': ast.literal_eval,
-            'dict': ast.literal_eval,
-            'tuple': ast.literal_eval,
-            'nonetype': lambda x: None
-        }
-
         try:
             brute = self._get_data()
         except FileNotFoundError:
@@ -416,6 +436,8 @@ class NKVManager(FileManager):
         content: dict[str, Any] = {}
         lines = brute.split('\n')
         sep = self.sep_type
+        get_converter = self.TYPE_MAP.get
+        setitem = content.__setitem__
 
         for linha in lines:
             linha = linha.strip()
@@ -441,7 +463,7 @@ class NKVManager(FileManager):
                 if raw_val.startswith('"') and raw_val.endswith('"'):
                     raw_val = raw_val[1:-1]
 
-                converter = TYPE_MAP.get(tipo)
+                converter = get_converter(tipo)
 
                 try:
                     if converter:
@@ -464,6 +486,6 @@ class NKVManager(FileManager):
                     except ValueError:
                         parsed = val_part
 
-            content[key] = parsed
+            setitem(key, parsed)
 
         return content
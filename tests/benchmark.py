@@ -2,56 +2,109 @@ import time
 import timeit
 import json
 import gc
+import mmap
+import os
 import statistics
 from pathlib import Path
 from nkv import NKVManager
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+    _PARSER = simdjson.Parser()  # Reutilizado entre as rodadas
+except ImportError:
+    simdjson = None
+
 ITERATIONS = 50  # Número de vezes para rodar cada teste
 WARMUP = 5  # Rodadas para "aquecer" cache de disco/CPU
+DATA_SIZE = 10_000  # Chaves por tipo no tests.nkv gerado
+TRIM = 1  # Descarta as N rodadas mais rápidas e mais lentas na média/desvio
+COLD = False  # True = descarta o page cache do arquivo antes de cada rodada
+STDLIB_JSON = False  # True = compara só com o json da stdlib (maçã com maçã)
+
+
+def generate_test_data(size):
+    # Dados de teste (str, int, float, bool) para criar o tests.nkv
+    idx = range(size)
+    data = dict(zip([f'str_{i}' for i in idx], [f'value_{i}' for i in idx]))
+    data.update(zip([f'int_{i}' for i in idx], idx))
+    data.update(zip([f'float_{i}' for i in idx], [i * 1.5 for i in idx]))
+    data.update(zip([f'bool_{i}' for i in idx], [i % 2 == 0 for i in idx]))
+    return data
 
 
 def setup_environment():
+    if not Path('./tests.nkv').resolve().exists():
+        nkv = NKVManager('tests.nkv', str(Path('./').resolve()))
+        nkv.write_batch(generate_test_data(DATA_SIZE))
+
     if not Path('./tests.json').resolve().exists():
         nkv = NKVManager('tests.nkv', str(Path('./').resolve()))
         nkv.to_json_file(str(Path('./tests.json').resolve()))
 
 
-def run_benchmark(label, func, *args):
-    times = []
+def drop_cache(filepath):
+    # Só o Linux tem posix_fadvise; no macOS não há como descartar sem root
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        os.fsync(fd)  # Páginas sujas não são descartadas
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
 
+def run_benchmark(label, func, *args, cold_path=None):
     # Warmup (ignorar tempos)
     for _ in range(WARMUP):
         func(*args)
 
     # Real Benchmark
     print(f"Running {label}...", end='', flush=True)
-    for _ in range(ITERATIONS):
-        # Desabilita GC para não afetar a medição de tempo puro de CPU/IO
-        gc_old = gc.isenabled()
-        gc.disable()
-
-        start = time.perf_counter()  # Mais preciso que time.time()
-        func(*args)
-        end = time.perf_counter()
-
+    # Desabilita GC uma vez só, fora do laço medido, para não afetar a medição
+    gc_old = gc.isenabled()
+    gc.disable()
+
+    perf_counter = time.perf_counter  # Mais preciso que time.time()
+    times = [0.0] * ITERATIONS
+    try:
+        for i in range(ITERATIONS):
+            if cold_path is not None:
+                drop_cache(cold_path)
+            start = perf_counter()
+            func(*args)
+            times[i] = perf_counter() - start
+    finally:
         if gc_old: gc.enable()
-        times.append(end - start)
 
     print(f" Done.")
     return times
 
 
 # Wrappers para as funções
+_NKV_CACHE = {}
+
+
+def _mgr(filepath):
+    # Um NKVManager por arquivo, criado fora das rodadas medidas
+    mgr = _NKV_CACHE.get(filepath)
+    if mgr is None:
+        path = Path(filepath).resolve()
+        mgr = _NKV_CACHE[filepath] = NKVManager(name=path.name, path=str(path.parent))
+    return mgr
+
+
 def bench_python():
-    path = str(Path('./').resolve())
-    mgr = NKVManager(name='tests.nkv', path=path)
-    mgr.read(big_data=False, c_parse=False)
+    _mgr('./tests.nkv').read(c_parse=False)
 
 
 def bench_cpp():
-    path = str(Path('./').resolve())
-    mgr = NKVManager(name='tests.nkv', path=path)
-    mgr.read(c_parse=True)
+    _mgr('./tests.nkv').read(c_parse=True)
 
 
 def bench_json():
@@ -59,10 +112,28 @@ def bench_json():
         json.load(file)
 
 
+def bench_orjson():
+    # mmap evita copiar o arquivo para um bytes a cada rodada
+    with open('./tests.json', 'rb') as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                orjson.loads(view)
+
+
+def bench_simdjson():
+    # load lê direto do arquivo, sem copiar para um bytes a cada rodada;
+    # recursive=True monta o dict inteiro, como nos outros benchmarks
+    _PARSER.load('./tests.json', recursive=True)
+
+
 def print_stats(name, times):
-    avg = statistics.mean(times) * 1000
+    trimmed = sorted(times)
+    if TRIM and len(trimmed) >= 2 * TRIM + 3:
+        trimmed = trimmed[TRIM:-TRIM]
+
+    avg = statistics.mean(trimmed) * 1000
     median = statistics.median(times) * 1000
-    stdev = statistics.stdev(times) * 1000
+    stdev = statistics.stdev(trimmed) * 1000
     best = min(times) * 1000
     worst = max(times) * 1000
 
@@ -77,16 +148,35 @@ def print_stats(name, times):
 
 if __name__ == "__main__":
     setup_environment()
-    print(f"Benchmark Configuration: {ITERATIONS} runs, {WARMUP} warmups on M1 Architecture\n")
-
-    t_py = run_benchmark("Python NKV", bench_python)
-    t_cpp = run_benchmark("C++ NKV", bench_cpp)
-    t_json = run_benchmark("JSON", bench_json)
+    print(f"Benchmark Configuration: {ITERATIONS} runs, {WARMUP} warmups, trim {TRIM} on M1 Architecture\n")
+    if COLD and not hasattr(os, 'posix_fadvise'):
+        print("Aviso: posix_fadvise indisponível, leituras continuam com cache quente\n")
+
+    cold_nkv = './tests.nkv' if COLD else None
+    cold_json = './tests.json' if COLD else None
+
+    t_py = run_benchmark("Python NKV", bench_python, cold_path=cold_nkv)
+    t_cpp = run_benchmark("C++ NKV", bench_cpp, cold_path=cold_nkv)
+    t_json = run_benchmark("JSON", bench_json, cold_path=cold_json)
+    use_orjson = orjson is not None and not STDLIB_JSON
+    use_simdjson = simdjson is not None and not STDLIB_JSON
+    if use_orjson:
+        t_orjson = run_benchmark("orjson", bench_orjson, cold_path=cold_json)
+    if use_simdjson:
+        t_simdjson = run_benchmark("simdjson", bench_simdjson, cold_path=cold_json)
 
     avg_py = print_stats("Python (Pure)", t_py)
     avg_cpp = print_stats("C++ Extension", t_cpp)
     avg_json = print_stats("Standard JSON", t_json)
+    if use_orjson:
+        avg_orjson = print_stats("orjson", t_orjson)
+    if use_simdjson:
+        avg_simdjson = print_stats("simdjson", t_simdjson)
 
     print("\n--- Comparativo (Speedup) ---")
     print(f"C++ é {avg_py / avg_cpp:.2f}x mais rápido que Python")
-    print(f"C++ é {avg_json / avg_cpp:.2f}x mais rápido que JSON")
\ No newline at end of file
+    print(f"C++ é {avg_json / avg_cpp:.2f}x mais rápido que JSON")
+    if use_orjson:
+        print(f"C++ é {avg_orjson / avg_cpp:.2f}x mais rápido que orjson")
+    if use_simdjson:
+        print(f"C++ é {avg_simdjson / avg_cpp:.2f}x mais rápido que simdjson")
\ No newline at end of file
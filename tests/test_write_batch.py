@@ -0,0 +1,60 @@
+import enum
+import os
+
+import pytest
+
+from nkv import NKVManager
+import nkv_parser  # type: ignore
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(nkv_parser, 'write_batch'),
+    reason='nkv_parser compilado sem write_batch'
+)
+
+
+class Cor(enum.Enum):
+    AZUL = 1
+
+    def __format__(self, spec):
+        return 'azul'
+
+
+class Texto(str):
+    def __format__(self, spec):
+        return 'texto'
+
+
+class Inteiro(int):
+    pass
+
+
+DATA = {
+    'str': 'x y', 'int': 1, 'big': 2 ** 70, 'float': 1.5, 'true': True, 'false': False,
+    'list': [1, '2'], 'tuple': (1,), 'dict': {'a': 1}, 'none': None,
+    'enum': Cor.AZUL, 'sub_str': Texto('abc'), 'sub_int': Inteiro(5),
+    'unicode': 'ção', Texto('chave'): 1,
+}
+
+
+def _write(tmp_path, subdir, data):
+    path = tmp_path / subdir
+    path.mkdir()
+    mgr = NKVManager(name='dados.nkv', path=str(path))
+    mgr.write_batch(data)
+    with open(mgr.arquivo, 'rb') as file:
+        return file.read()
+
+
+def test_native_matches_python(tmp_path, monkeypatch):
+    native = _write(tmp_path, 'native', DATA)
+
+    monkeypatch.delattr(nkv_parser, 'write_batch')
+    python = _write(tmp_path, 'python', DATA)
+
+    assert native == python
+
+
+@pytest.mark.skipif(not os.path.exists('/dev/full'), reason='sem /dev/full')
+def test_native_write_error_raises():
+    with pytest.raises(OSError):
+        nkv_parser.write_batch(file='/dev/full', data={'a': 'x' * 100_000})